@@ -12,45 +12,72 @@ Tech Stack:
 """
 
 import os
+import sys
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Awaitable
 from dataclasses import dataclass, field
 from enum import Enum
-import json
+from ulid import ULID
+import orjson
+import hashlib
+import uuid
+from functools import lru_cache
 
 # LangChain imports for multi-agent coordination
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
-from langchain.tools import Tool, StructuredTool
 from langchain.schema import SystemMessage, HumanMessage
 from langchain.memory import ConversationBufferMemory
 
 # CrewAI for advanced multi-agent orchestration
-from crewai import Agent, Task, Crew, Process
-from crewai_tools import tool
+from crewai import Agent, Task, Crew, Process, LLM
+import litellm
+from crewai.tools.base_tool import Tool as CrewTool
 
 # LlamaIndex for data ingestion and retrieval
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Document
+from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Document, StorageContext, load_index_from_storage
 from llama_index.core.node_parser import SimpleNodeParser
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.llms.openai import OpenAI as LlamaOpenAI
+from llama_index.vector_stores.qdrant import QdrantVectorStore
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance, VectorParams, ScalarQuantization, ScalarQuantizationConfig, ScalarType
+)
 
 # FastAPI for backend
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import uvicorn
 
+# Caching
+import redis
+from redis import asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from async_lru import alru_cache
+
+# Numerical & geospatial clustering
+import io
+import numpy as np
+import pandas as pd
+from sklearn.cluster import DBSCAN
+
 # AWS Services
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
 
 # External APIs
-import requests
-import tweepy
+import aiohttp
+import httpx
+import ahocorasick
+from tweepy.asynchronous import AsyncClient as TwitterAsyncClient
 
 # Logging setup
 logging.basicConfig(
@@ -68,6 +95,7 @@ class Config:
     
     # API Keys
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
     OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
     TWITTER_API_KEY = os.getenv("TWITTER_API_KEY")
     TWITTER_API_SECRET = os.getenv("TWITTER_API_SECRET")
@@ -83,11 +111,42 @@ class Config:
     S3_BUCKET = os.getenv("S3_BUCKET", "disaster-response-data")
     DYNAMODB_TABLE = os.getenv("DYNAMODB_TABLE", "sos-messages")
     SNS_TOPIC_ARN = os.getenv("SNS_TOPIC_ARN")
+    SOS_BATCH_SIZE = 25  # DynamoDB BatchWriteItem limit
+    SOS_FLUSH_INTERVAL = float(os.getenv("SOS_FLUSH_INTERVAL", "0.2"))  # seconds
+    SOS_QUEUE_SIZE = int(os.getenv("SOS_QUEUE_SIZE", "10000"))
+    SOS_WRITE_RETRIES = 3
+    SOS_RETRY_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+    
+    # Cache Configuration
+    REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+    REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+    REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "0.5"))  # seconds, so an unreachable cache fails fast
+    COORD_CACHE_PRECISION = 2  # decimal places (~1 km) for API response caching
     
     # Model Configuration
     LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4-turbo-preview")  # or llama3
     VISION_MODEL = os.getenv("VISION_MODEL", "sam")  # SAM or SegFormer
     EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1536"))
+    
+    # Vector Store Configuration
+    VECTOR_STORE_TYPE = os.getenv("VECTOR_STORE_TYPE", "simple")  # simple or qdrant
+    INDEX_PERSIST_DIR = os.getenv("INDEX_PERSIST_DIR", "./index_store")
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))  # server worker processes
+    QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
+    QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+    QDRANT_COLLECTION = os.getenv("QDRANT_COLLECTION", "disaster-response")
+    
+    # Agent Configuration
+    AGENT_MAX_ITER = int(os.getenv("AGENT_MAX_ITER", "8"))  # caps tool-loop turns per task
+    TOOL_OUTPUT_MAX_CHARS = int(os.getenv("TOOL_OUTPUT_MAX_CHARS", "4000"))  # per tool result fed back to the agent
+    TOOL_CALL_TIMEOUT = float(os.getenv("TOOL_CALL_TIMEOUT", "60"))  # seconds a crew thread waits on a tool
+    CREW_WORKERS = int(os.getenv("CREW_WORKERS", "8"))  # threads running blocking crew kickoffs
+    
+    # SOS Clustering
+    SOS_CLUSTER_RADIUS_KM = float(os.getenv("SOS_CLUSTER_RADIUS_KM", "5"))
+    EARTH_RADIUS_KM = 6371.0
 
 
 # ============================================================================
@@ -143,6 +202,30 @@ class SOSMessageCreate(BaseModel):
     location: Dict[str, float]
     source: str = "manual"
 
+# Agent Tool Input Models
+class LocationInput(BaseModel):
+    lat: float = Field(description="Latitude of the area of interest")
+    lng: float = Field(description="Longitude of the area of interest")
+
+class SOSSearchInput(LocationInput):
+    keywords: List[str] = Field(
+        default=["SOS", "help", "emergency", "trapped"],
+        description="Keywords indicating a distress signal"
+    )
+
+class FireSearchInput(LocationInput):
+    radius_km: int = Field(default=50, description="Search radius in kilometers")
+
+class AlertInput(BaseModel):
+    message: str = Field(description="Evacuation alert text")
+    broadcast: bool = Field(
+        description="True only to alert every subscriber of the regional alert topic"
+    )
+    phone_numbers: List[str] = Field(
+        default_factory=list,
+        description="Recipients for direct SMS alerts"
+    )
+
 
 # ============================================================================
 # AWS SERVICES INTEGRATION
@@ -152,84 +235,164 @@ class AWSService:
     """AWS services integration (S3, DynamoDB, SNS, Lambda)"""
     
     def __init__(self):
-        self.s3_client = boto3.client(
-            's3',
-            region_name=Config.AWS_REGION,
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY
-        )
-        self.dynamodb = boto3.resource(
-            'dynamodb',
-            region_name=Config.AWS_REGION,
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY
-        )
-        self.sns_client = boto3.client(
-            'sns',
+        # One session and pooled keep-alive connections shared by every client
+        session = boto3.Session(
             region_name=Config.AWS_REGION,
             aws_access_key_id=Config.AWS_ACCESS_KEY,
             aws_secret_access_key=Config.AWS_SECRET_KEY
         )
-        self.lambda_client = boto3.client(
-            'lambda',
-            region_name=Config.AWS_REGION,
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY
+        client_config = BotoConfig(
+            tcp_keepalive=True,
+            max_pool_connections=64,
+            connect_timeout=2,
+            read_timeout=5,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
         )
+        self.s3_client = session.client('s3', config=client_config)
+        self.dynamodb = session.resource('dynamodb', config=client_config)
+        self.sns_client = session.client('sns', config=client_config)
+        self.lambda_client = session.client('lambda', config=client_config)
+        
+        # SOS writes are queued and flushed to DynamoDB in batches
+        self._sos_queue: asyncio.Queue = asyncio.Queue(maxsize=Config.SOS_QUEUE_SIZE)
+        self._sos_flusher: Optional[asyncio.Task] = None
         logger.info("AWS services initialized")
     
+    def start_sos_flusher(self):
+        """Start the background task that batches SOS writes"""
+        self._sos_flusher = asyncio.create_task(self._flush_sos_messages())
+        self._sos_flusher.add_done_callback(self._on_sos_flusher_done)
+    
+    def _on_sos_flusher_done(self, task: asyncio.Task):
+        """Restart the SOS flusher if it died unexpectedly"""
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error("SOS flusher crashed, restarting", exc_info=task.exception())
+        self.start_sos_flusher()
+    
+    async def stop_sos_flusher(self):
+        """Flush pending SOS messages and stop the background writer"""
+        if self._sos_flusher:
+            await self._sos_queue.put(None)
+            try:
+                await self._sos_flusher
+            except Exception as e:
+                logger.error(f"SOS flusher error on shutdown: {e}")
+            self._sos_flusher = None
+    
     async def store_sos_message(self, sos: SOSMessage):
-        """Store SOS message in DynamoDB"""
-        try:
-            table = self.dynamodb.Table(Config.DYNAMODB_TABLE)
-            table.put_item(Item={
-                'id': sos.id,
-                'text': sos.text,
-                'location': json.dumps(sos.location),
-                'timestamp': sos.timestamp.isoformat(),
-                'source': sos.source,
-                'severity': sos.severity.value if sos.severity else None,
-                'verified': sos.verified
-            })
-            logger.info(f"SOS message stored: {sos.id}")
-        except ClientError as e:
-            logger.error(f"DynamoDB error: {e}")
+        """Queue SOS message for a batched DynamoDB write
+        
+        Raises asyncio.QueueFull when the write backlog is at capacity.
+        """
+        self._sos_queue.put_nowait(sos)
+    
+    async def _flush_sos_messages(self):
+        """Drain the SOS queue in batches of up to 25 or every flush interval"""
+        loop = asyncio.get_running_loop()
+        running = True
+        while running:
+            batch = []
+            sos = await self._sos_queue.get()
+            deadline = loop.time() + Config.SOS_FLUSH_INTERVAL
+            while sos is not None:
+                batch.append(sos)
+                if len(batch) >= Config.SOS_BATCH_SIZE:
+                    break
+                try:
+                    sos = await asyncio.wait_for(self._sos_queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+            else:
+                running = False
+            if batch:
+                await self._write_sos_batch(batch)
+    
+    async def _write_sos_batch(self, batch: List[SOSMessage]):
+        """Write a batch of SOS messages, retrying transient failures with backoff"""
+        delay = Config.SOS_RETRY_BACKOFF
+        for attempt in range(1, Config.SOS_WRITE_RETRIES + 1):
+            try:
+                await asyncio.to_thread(self._put_sos_batch, batch)
+                logger.info(f"SOS messages stored: {', '.join(sos.id for sos in batch)}")
+                return
+            except Exception as e:
+                logger.warning(f"DynamoDB error (attempt {attempt}/{Config.SOS_WRITE_RETRIES}): {e}")
+                if attempt < Config.SOS_WRITE_RETRIES:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+        logger.error(f"Failed to store SOS messages: {', '.join(sos.id for sos in batch)}")
+    
+    def _put_sos_batch(self, batch: List[SOSMessage]):
+        """Write SOS messages with DynamoDB BatchWriteItem"""
+        table = self.dynamodb.Table(Config.DYNAMODB_TABLE)
+        with table.batch_writer(overwrite_by_pkeys=['id']) as writer:
+            for sos in batch:
+                writer.put_item(Item={
+                    'id': sos.id,
+                    'text': sos.text,
+                    'location': orjson.dumps(sos.location).decode(),
+                    'timestamp': sos.timestamp.isoformat(),
+                    'source': sos.source,
+                    'severity': sos.severity.value if sos.severity else None,
+                    'verified': sos.verified
+                })
     
     async def upload_to_s3(self, data: bytes, key: str):
         """Upload data to S3"""
         try:
-            self.s3_client.put_object(
+            await asyncio.to_thread(
+                self.s3_client.put_object,
                 Bucket=Config.S3_BUCKET,
                 Key=key,
                 Body=data
             )
             logger.info(f"Uploaded to S3: {key}")
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error(f"S3 upload error: {e}")
     
-    async def send_evacuation_alert(self, message: str, phone_numbers: List[str]):
+    async def send_evacuation_alert(self, message: str, phone_numbers: Optional[List[str]] = None,
+                                    broadcast: bool = False):
         """Send evacuation messages via SNS"""
+        phone_numbers = phone_numbers or []
         try:
-            for phone in phone_numbers:
-                self.sns_client.publish(
-                    PhoneNumber=phone,
+            if broadcast:
+                if not Config.SNS_TOPIC_ARN:
+                    logger.error("SNS_TOPIC_ARN is not configured, broadcast alert not sent")
+                    return
+                # Single publish fans out to every subscriber of the alert topic
+                await asyncio.to_thread(
+                    self.sns_client.publish,
+                    TopicArn=Config.SNS_TOPIC_ARN,
                     Message=message
                 )
-            logger.info(f"Evacuation alerts sent to {len(phone_numbers)} recipients")
-        except ClientError as e:
+                logger.info(f"Evacuation alert published to {Config.SNS_TOPIC_ARN}")
+                return
+            
+            # Direct SMS has no batch API, so publish concurrently off the event loop
+            results = await asyncio.gather(*[
+                asyncio.to_thread(self.sns_client.publish, PhoneNumber=phone, Message=message)
+                for phone in phone_numbers
+            ], return_exceptions=True)
+            failures = [r for r in results if isinstance(r, Exception)]
+            for error in failures:
+                logger.error(f"SNS error: {error}")
+            logger.info(f"Evacuation alerts sent to {len(phone_numbers) - len(failures)} recipients")
+        except (ClientError, BotoCoreError) as e:
             logger.error(f"SNS error: {e}")
     
     async def invoke_lambda(self, function_name: str, payload: Dict):
         """Invoke Lambda function for real-time processing"""
         try:
-            response = self.lambda_client.invoke(
+            response = await asyncio.to_thread(
+                self.lambda_client.invoke,
                 FunctionName=function_name,
                 InvocationType='Event',
-                Payload=json.dumps(payload)
+                Payload=orjson.dumps(payload)
             )
             logger.info(f"Lambda invoked: {function_name}")
             return response
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error(f"Lambda error: {e}")
 
 
@@ -237,78 +400,165 @@ class AWSService:
 # EXTERNAL DATA SOURCES
 # ============================================================================
 
+def create_http_session() -> aiohttp.ClientSession:
+    """Shared HTTP session with a pooled keep-alive connector"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+
+def create_openai_http_client() -> httpx.Client:
+    """Shared keep-alive connection pool for every OpenAI/LLM client"""
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=60
+    )
+
+
 class OpenWeatherMapAPI:
     """OpenWeatherMap API for weather forecasting"""
     
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
         self.api_key = Config.OPENWEATHER_API_KEY
         self.base_url = "https://api.openweathermap.org/data/2.5"
     
     async def get_weather(self, lat: float, lon: float) -> Dict:
         """Get current weather and forecast"""
         try:
-            response = requests.get(
-                f"{self.base_url}/weather",
-                params={
-                    "lat": lat,
-                    "lon": lon,
-                    "appid": self.api_key,
-                    "units": "metric"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            logger.info(f"Weather data retrieved for ({lat}, {lon})")
-            return {
-                "temperature": data["main"]["temp"],
-                "conditions": data["weather"][0]["main"],
-                "wind_speed": data["wind"]["speed"],
-                "humidity": data["main"]["humidity"],
-                "visibility": data.get("visibility", 10000)
-            }
+            return await self.fetch_weather(lat, lon)
         except Exception as e:
             logger.error(f"OpenWeatherMap API error: {e}")
             return {}
+    
+    async def fetch_weather(self, lat: float, lon: float) -> Dict:
+        """Get current weather, raising on API errors"""
+        return await self._fetch_weather(
+            round(lat, Config.COORD_CACHE_PRECISION),
+            round(lon, Config.COORD_CACHE_PRECISION)
+        )
+    
+    @alru_cache(maxsize=4096, ttl=600)
+    async def _fetch_weather(self, lat: float, lon: float) -> Dict:
+        """Fetch weather for coarsened coordinates, cached for 10 minutes"""
+        async with self.session.get(
+            f"{self.base_url}/weather",
+            params={
+                "lat": lat,
+                "lon": lon,
+                "appid": self.api_key,
+                "units": "metric"
+            }
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        
+        logger.info(f"Weather data retrieved for ({lat}, {lon})")
+        return {
+            "temperature": data["main"]["temp"],
+            "conditions": data["weather"][0]["main"],
+            "wind_speed": data["wind"]["speed"],
+            "humidity": data["main"]["humidity"],
+            "visibility": data.get("visibility", 10000)
+        }
 
 
 class NASAFirmsAPI:
     """NASA FIRMS API for fire detection and satellite imagery"""
     
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
         self.api_key = Config.NASA_FIRMS_KEY
         self.base_url = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
     
     async def get_active_fires(self, lat: float, lon: float, radius: int = 50) -> List[Dict]:
         """Get active fires from satellite data"""
         try:
-            # FIRMS API format: /MAP_KEY/VIIRS_SNPP_NRT/world/1/2024-01-01
-            url = f"{self.base_url}/{self.api_key}/VIIRS_SNPP_NRT/world/1/{datetime.now().strftime('%Y-%m-%d')}"
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            logger.info(f"NASA FIRMS data retrieved for ({lat}, {lon})")
-            # Parse CSV and filter by location
-            return self._parse_fire_data(response.text, lat, lon, radius)
+            return await self.fetch_active_fires(lat, lon, radius)
         except Exception as e:
             logger.error(f"NASA FIRMS API error: {e}")
             return []
     
-    def _parse_fire_data(self, csv_data: str, lat: float, lon: float, radius: int) -> List[Dict]:
-        """Parse CSV fire data and filter by proximity"""
-        fires = []
-        # Simplified parsing
-        for line in csv_data.split('\n')[1:]:
-            if line:
-                parts = line.split(',')
-                if len(parts) > 5:
-                    fires.append({
-                        "latitude": float(parts[0]),
-                        "longitude": float(parts[1]),
-                        "brightness": float(parts[2]),
-                        "confidence": parts[8]
-                    })
-        return fires[:10]  # Return top 10
+    async def fetch_active_fires(self, lat: float, lon: float, radius: int = 50) -> List[Dict]:
+        """Get active fires, raising on API errors"""
+        return await self._fetch_active_fires(
+            round(lat, Config.COORD_CACHE_PRECISION),
+            round(lon, Config.COORD_CACHE_PRECISION),
+            radius,
+            datetime.now().strftime('%Y-%m-%d')
+        )
+    
+    @alru_cache(maxsize=4096, ttl=900)
+    async def _fetch_active_fires(self, lat: float, lon: float, radius: int, date: str) -> List[Dict]:
+        """Fetch fires for coarsened coordinates and day, cached for 15 minutes"""
+        # FIRMS API format: /MAP_KEY/VIIRS_SNPP_NRT/west,south,east,north/1/2024-01-01
+        # Request only the bounding box around the radius instead of the whole world
+        csv_chunks = await asyncio.gather(*[
+            self._fetch_fire_csv(f"{self.base_url}/{self.api_key}/VIIRS_SNPP_NRT/{box}/1/{date}")
+            for box in self._bounding_boxes(lat, lon, radius)
+        ])
+        
+        logger.info(f"NASA FIRMS data retrieved for ({lat}, {lon})")
+        # Parse CSV and filter by location
+        return self._parse_fire_data(csv_chunks, lat, lon, radius)
+    
+    async def _fetch_fire_csv(self, url: str) -> bytes:
+        """Download one FIRMS area CSV"""
+        # aiohttp negotiates gzip and decompresses transparently
+        async with self.session.get(url, headers={"Accept-Encoding": "gzip"}) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    @staticmethod
+    def _bounding_boxes(lat: float, lon: float, radius: int) -> List[str]:
+        """Boxes enclosing a radius in km, as FIRMS west,south,east,north; split at the antimeridian"""
+        dlat = radius / 111.0
+        dlon = radius / (111.0 * max(np.cos(np.radians(lat)), 0.01))
+        south, north = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+        west, east = lon - dlon, lon + dlon
+        if dlon >= 180.0 or abs(lat) + dlat >= 90.0:
+            # The circle wraps all the way around or contains a pole
+            spans = [(-180.0, 180.0)]
+        elif west < -180.0:
+            spans = [(west + 360.0, 180.0), (-180.0, east)]
+        elif east > 180.0:
+            spans = [(west, 180.0), (-180.0, east - 360.0)]
+        else:
+            spans = [(west, east)]
+        return [f"{w:.4f},{south:.4f},{e:.4f},{north:.4f}" for w, e in spans]
+    
+    @staticmethod
+    def _parse_fire_data(csv_chunks: List[bytes], lat: float, lon: float, radius: int) -> List[Dict]:
+        """Parse CSV fire data and keep the brightest fires within radius km"""
+        # Parse raw bytes directly, skipping an intermediate decoded str
+        df = pd.concat([
+            pd.read_csv(
+                io.BytesIO(csv_data),
+                usecols=['latitude', 'longitude', 'bright_ti4', 'confidence'],
+                dtype={
+                    'latitude': 'float32',
+                    'longitude': 'float32',
+                    'bright_ti4': 'float32',
+                    'confidence': 'category'
+                },
+                engine='c'
+            )
+            for csv_data in csv_chunks
+        ], ignore_index=True)
+        if df.empty:
+            return []
+        
+        # Vectorized haversine distance from the query point
+        lat0, lon0 = np.radians(lat), np.radians(lon)
+        lat1, lon1 = np.radians(df['latitude'].values), np.radians(df['longitude'].values)
+        distance = 2 * Config.EARTH_RADIUS_KM * np.arcsin(np.sqrt(
+            np.sin((lat1 - lat0) / 2) ** 2
+            + np.cos(lat0) * np.cos(lat1) * np.sin((lon1 - lon0) / 2) ** 2
+        ))
+        
+        nearby = df[distance <= radius].nlargest(10, 'bright_ti4')  # Return top 10
+        return nearby.rename(columns={'bright_ti4': 'brightness'}).to_dict('records')
 
 
 class GoogleEarthEngineAPI:
@@ -320,56 +570,84 @@ class GoogleEarthEngineAPI:
     async def get_terrain_data(self, lat: float, lon: float) -> Dict:
         """Get terrain elevation and flood risk data"""
         try:
-            # Simulated GEE data (actual implementation requires ee library)
-            logger.info(f"Terrain data retrieved for ({lat}, {lon})")
-            return {
-                "elevation": 150.5,
-                "slope": 5.2,
-                "flood_risk": "medium",
-                "land_cover": "urban"
-            }
+            return await self.fetch_terrain_data(lat, lon)
         except Exception as e:
             logger.error(f"Google Earth Engine API error: {e}")
             return {}
+    
+    async def fetch_terrain_data(self, lat: float, lon: float) -> Dict:
+        """Get terrain data, raising on API errors"""
+        return await self._fetch_terrain_data(
+            round(lat, Config.COORD_CACHE_PRECISION),
+            round(lon, Config.COORD_CACHE_PRECISION)
+        )
+    
+    @alru_cache(maxsize=4096, ttl=3600)
+    async def _fetch_terrain_data(self, lat: float, lon: float) -> Dict:
+        """Fetch terrain for coarsened coordinates, cached for an hour"""
+        # Simulated GEE data (actual implementation requires ee library)
+        logger.info(f"Terrain data retrieved for ({lat}, {lon})")
+        return {
+            "elevation": 150.5,
+            "slope": 5.2,
+            "flood_risk": "medium",
+            "land_cover": "urban"
+        }
 
 
 class TwitterSOSDetector:
     """Twitter/X API for SOS signal detection"""
     
-    def __init__(self):
-        auth = tweepy.OAuthHandler(
-            Config.TWITTER_API_KEY,
-            Config.TWITTER_API_SECRET
-        )
-        auth.set_access_token(
-            Config.TWITTER_ACCESS_TOKEN,
-            Config.TWITTER_ACCESS_SECRET
+    def __init__(self, session: aiohttp.ClientSession):
+        self.client = TwitterAsyncClient(
+            consumer_key=Config.TWITTER_API_KEY,
+            consumer_secret=Config.TWITTER_API_SECRET,
+            access_token=Config.TWITTER_ACCESS_TOKEN,
+            access_token_secret=Config.TWITTER_ACCESS_SECRET
         )
-        self.api = tweepy.API(auth)
+        # Without a session tweepy opens and tears down a new one per request
+        self.client.session = session
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _keyword_automaton(keywords: tuple) -> ahocorasick.Automaton:
+        """Aho-Corasick automaton matching all keywords in one pass"""
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), keyword)
+        automaton.make_automaton()
+        return automaton
     
     async def monitor_sos_keywords(self, keywords: List[str], location: tuple) -> List[Dict]:
-        """Monitor Twitter for SOS keywords"""
-        try:
-            tweets = []
-            for keyword in keywords:
-                search_results = self.api.search_tweets(
-                    q=f"{keyword} geocode:{location[0]},{location[1]},50km",
-                    count=10,
-                    lang="en"
-                )
-                for tweet in search_results:
-                    tweets.append({
-                        "text": tweet.text,
-                        "user": tweet.user.screen_name,
-                        "location": tweet.coordinates,
-                        "created_at": tweet.created_at
-                    })
-            
-            logger.info(f"Found {len(tweets)} potential SOS messages")
-            return tweets
-        except Exception as e:
-            logger.error(f"Twitter API error: {e}")
-            return []
+        """Monitor Twitter for SOS keywords, raising on API errors"""
+        # One OR query for all keywords; v2 point_radius takes [lon lat radius], capped at 25mi
+        terms = " OR ".join(f'"{k}"' if " " in k else k for k in keywords)
+        response = await self.client.search_recent_tweets(
+            query=f"({terms}) point_radius:[{location[1]} {location[0]} 25mi] lang:en",
+            max_results=100,
+            expansions=["author_id"],
+            tweet_fields=["created_at", "geo"],
+            user_fields=["username"],
+            user_auth=True
+        )
+        
+        automaton = self._keyword_automaton(tuple(keywords))
+        users = {u.id: u.username for u in response.includes.get("users", [])}
+        tweets = []
+        for tweet in response.data or []:
+            matched = sorted({k for _, k in automaton.iter(tweet.text.lower())})
+            if not matched:
+                continue
+            tweets.append({
+                "text": tweet.text,
+                "user": users.get(tweet.author_id),
+                "location": tweet.geo,
+                "created_at": tweet.created_at,
+                "keywords": matched
+            })
+        
+        logger.info(f"Found {len(tweets)} potential SOS messages")
+        return tweets
 
 
 # ============================================================================
@@ -379,52 +657,181 @@ class TwitterSOSDetector:
 class DataIngestionService:
     """LlamaIndex for data ingestion and retrieval"""
     
-    def __init__(self):
-        self.llm = LlamaOpenAI(model=Config.LLM_MODEL, api_key=Config.OPENAI_API_KEY)
+    def __init__(self, openai_http: httpx.Client):
+        self.llm = LlamaOpenAI(
+            model=Config.LLM_MODEL,
+            api_key=Config.OPENAI_API_KEY,
+            http_client=openai_http
+        )
         self.embed_model = OpenAIEmbedding(
             model=Config.EMBEDDING_MODEL,
-            api_key=Config.OPENAI_API_KEY
+            api_key=Config.OPENAI_API_KEY,
+            http_client=openai_http
         )
-        self.index = None
+        self.node_parser = SimpleNodeParser.from_defaults()
+        self.qdrant = None
+        if Config.VECTOR_STORE_TYPE == "qdrant":
+            self.index = self._load_qdrant_index()
+        else:
+            self.index = self._load_index()
+            if self._shared_local_store():
+                logger.warning(
+                    f"Simple vector store is per-process but {Config.WEB_CONCURRENCY} workers share "
+                    f"{Config.INDEX_PERSIST_DIR}; ingestion is disabled. Set VECTOR_STORE_TYPE=qdrant."
+                )
+        # Serializes in-memory index mutation and persistence
+        self._index_lock = asyncio.Lock()
         logger.info("LlamaIndex data ingestion service initialized")
     
+    def _shared_local_store(self) -> bool:
+        """Whether several workers would persist their own copies to one directory"""
+        return not self.qdrant and Config.WEB_CONCURRENCY > 1
+    
+    def _load_index(self) -> VectorStoreIndex:
+        """Load the persisted vector index, or start an empty one"""
+        if os.path.exists(os.path.join(Config.INDEX_PERSIST_DIR, "docstore.json")):
+            storage_context = StorageContext.from_defaults(persist_dir=Config.INDEX_PERSIST_DIR)
+            return load_index_from_storage(storage_context, embed_model=self.embed_model)
+        return VectorStoreIndex([], embed_model=self.embed_model)
+    
+    def _load_qdrant_index(self) -> VectorStoreIndex:
+        """Index backed by a shared Qdrant collection with int8 scalar quantization"""
+        self.qdrant = QdrantClient(url=Config.QDRANT_URL, api_key=Config.QDRANT_API_KEY)
+        if not self.qdrant.collection_exists(Config.QDRANT_COLLECTION):
+            # float32 originals stay on disk for rescoring; int8 copies are searched in RAM
+            self.qdrant.create_collection(
+                collection_name=Config.QDRANT_COLLECTION,
+                vectors_config=VectorParams(
+                    size=Config.EMBEDDING_DIM,
+                    distance=Distance.COSINE,
+                    on_disk=True
+                ),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True
+                    )
+                )
+            )
+        vector_store = QdrantVectorStore(client=self.qdrant, collection_name=Config.QDRANT_COLLECTION)
+        return VectorStoreIndex.from_vector_store(vector_store, embed_model=self.embed_model)
+    
+    def _is_empty(self) -> bool:
+        """Whether any documents have been ingested"""
+        if self.qdrant:
+            return self.qdrant.count(Config.QDRANT_COLLECTION).count == 0
+        return not self.index.docstore.docs
+    
     async def ingest_disaster_data(self, documents: List[str]):
         """Ingest disaster-related documents for RAG"""
+        if self._shared_local_store():
+            # Each worker would overwrite the others' documents on persist
+            raise RuntimeError("Multi-worker ingestion requires VECTOR_STORE_TYPE=qdrant")
         docs = [Document(text=doc) for doc in documents]
         
-        # Create vector store index
-        self.index = VectorStoreIndex.from_documents(
-            docs,
-            llm=self.llm,
-            embed_model=self.embed_model
-        )
+        # Embed only the new documents and append them to the index
+        def insert():
+            self.index.insert_nodes(self.node_parser.get_nodes_from_documents(docs))
+            if not self.qdrant:
+                self.index.storage_context.persist(persist_dir=Config.INDEX_PERSIST_DIR)
+        
+        async with self._index_lock:
+            await asyncio.to_thread(insert)
         logger.info(f"Ingested {len(documents)} documents")
     
     async def query_knowledge_base(self, query: str) -> str:
         """Query ingested knowledge base"""
-        if not self.index:
+        if self._is_empty():
             return "No data ingested yet"
         
-        query_engine = self.index.as_query_engine()
+        query_engine = self.index.as_query_engine(llm=self.llm)
         response = query_engine.query(query)
         return str(response)
     
     async def cluster_sos_locations(self, sos_messages: List[SOSMessage]) -> List[Dict]:
-        """Cluster SOS messages by geolocation using embeddings"""
-        # Create embeddings for location-based clustering
-        locations = [f"{msg.location['lat']},{msg.location['lng']}" for msg in sos_messages]
+        """Cluster SOS messages by great-circle distance with DBSCAN"""
+        if not sos_messages:
+            return []
         
-        # Use embeddings for semantic clustering
-        embeddings = [self.embed_model.get_text_embedding(loc) for loc in locations]
+        coords = np.radians([[msg.location['lat'], msg.location['lng']] for msg in sos_messages])
+        labels = DBSCAN(
+            eps=Config.SOS_CLUSTER_RADIUS_KM / Config.EARTH_RADIUS_KM,
+            min_samples=2,
+            metric='haversine',
+            algorithm='ball_tree'
+        ).fit_predict(coords)
         
-        # Simple clustering (use sklearn in production)
-        clusters = self._simple_cluster(embeddings, locations)
+        # Noise points (-1) are isolated SOS calls and each get their own cluster
+        groups: Dict[Any, List[SOSMessage]] = {}
+        for i, (label, msg) in enumerate(zip(labels, sos_messages)):
+            groups.setdefault(label if label != -1 else f"noise-{i}", []).append(msg)
+        
+        clusters = [
+            {
+                "cluster_id": cluster_id,
+                "locations": [f"{msg.location['lat']},{msg.location['lng']}" for msg in msgs],
+                "message_ids": [msg.id for msg in msgs]
+            }
+            for cluster_id, msgs in enumerate(groups.values())
+        ]
         logger.info(f"Clustered {len(sos_messages)} SOS messages into {len(clusters)} groups")
         return clusters
+
+
+# ============================================================================
+# TOOL RESULT CACHE
+# ============================================================================
+
+class ToolResultCache:
+    """Redis-backed exact cache for agent tool results, shared across workers"""
+    
+    def __init__(self):
+        self.client = aioredis.Redis(
+            host=Config.REDIS_HOST,
+            port=Config.REDIS_PORT,
+            db=Config.REDIS_DB,
+            socket_connect_timeout=Config.REDIS_TIMEOUT,
+            socket_timeout=Config.REDIS_TIMEOUT,
+            retry=Retry(NoBackoff(), 0)  # a cache miss beats waiting on retries
+        )
+    
+    @staticmethod
+    def _key(name: str, params: Dict) -> str:
+        """Cache key from validated tool arguments, with coordinates coarsened"""
+        params = {
+            k: round(v, Config.COORD_CACHE_PRECISION) if k in ("lat", "lng") else v
+            for k, v in params.items()
+        }
+        return "tool:" + hashlib.sha256(
+            orjson.dumps([name, params], option=orjson.OPT_SORT_KEYS, default=str)
+        ).hexdigest()
+    
+    async def get_or_call(self, name: str, params: Dict, call: Callable[[], Awaitable], ttl: int) -> Any:
+        """Return the cached result for these arguments, or await call and cache it for ttl seconds
+        
+        Exceptions from call propagate and nothing is cached, so a failed lookup is never
+        served to other workers as an empty result.
+        """
+        key = self._key(name, params)
+        try:
+            hit = await self.client.get(key)
+            if hit is not None:
+                logger.info(f"Tool cache hit: {name}")
+                return orjson.loads(hit)
+        except redis.RedisError as e:
+            logger.warning(f"Tool cache read error: {e}")
+        
+        result = await call()
+        try:
+            await self.client.setex(key, ttl, orjson.dumps(result, default=str))
+        except redis.RedisError as e:
+            logger.warning(f"Tool cache write error: {e}")
+        return result
     
-    def _simple_cluster(self, embeddings, locations):
-        """Simplified clustering logic"""
-        return [{"cluster_id": i, "locations": [locations[i]]} for i in range(min(3, len(locations)))]
+    async def close(self):
+        """Close pooled Redis connections"""
+        await self.client.aclose()
 
 
 # ============================================================================
@@ -434,29 +841,107 @@ class DataIngestionService:
 class DisasterResponseCrew:
     """CrewAI-based multi-agent coordination system"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model=Config.LLM_MODEL,
-            api_key=Config.OPENAI_API_KEY
-        )
+    def __init__(self, http_session: aiohttp.ClientSession, openai_http: httpx.Client, aws: AWSService):
+        self.llm = self._create_llm()
         
         # Initialize external services
-        self.aws = AWSService()
-        self.weather_api = OpenWeatherMapAPI()
-        self.nasa_api = NASAFirmsAPI()
+        self.aws = aws
+        self.weather_api = OpenWeatherMapAPI(http_session)
+        self.nasa_api = NASAFirmsAPI(http_session)
         self.gee_api = GoogleEarthEngineAPI()
-        self.twitter_api = TwitterSOSDetector()
-        self.data_service = DataIngestionService()
+        self.twitter_api = TwitterSOSDetector(http_session)
+        self.data_service = DataIngestionService(openai_http)
+        self.tool_cache = ToolResultCache()
+        
+        # Tools run inside crew worker threads and schedule their coroutines here,
+        # so they share the aiohttp session bound to this loop
+        self._loop = asyncio.get_running_loop()
+        # Crew kickoffs block for the whole LLM run; keep them off the default
+        # executor that short boto3 calls (SOS writes, SNS, S3) rely on
+        self._crew_executor = ThreadPoolExecutor(max_workers=Config.CREW_WORKERS, thread_name_prefix="crew")
         
-        # Create agents
-        self.sos_analyzer_agent = self._create_sos_analyzer()
-        self.weather_monitor_agent = self._create_weather_monitor()
-        self.satellite_analyst_agent = self._create_satellite_analyst()
-        self.resource_coordinator_agent = self._create_resource_coordinator()
-        self.communication_agent = self._create_communication_agent()
+        # Task templates are validated once; each incident gets formatted copies
+        self._task_templates = self._create_task_templates()
         
         logger.info("CrewAI multi-agent system initialized")
     
+    def _create_llm(self) -> LLM:
+        """Shared LLM with provider prompt caching on the static agent system prompt"""
+        model = Config.LLM_MODEL
+        if "claude" not in model:
+            # OpenAI caches repeated prompt prefixes automatically
+            return LLM(model=model, api_key=Config.OPENAI_API_KEY)
+        
+        # Role/goal/backstory form the system message; task input stays uncached
+        return LLM(
+            model=model,
+            api_key=Config.ANTHROPIC_API_KEY,
+            extra_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+            cache_control_injection_points=[{"location": "message", "role": "system"}]
+        )
+    
+    def _run_on_loop(self, coro) -> Any:
+        """Run a coroutine on the server event loop from a crew worker thread"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise RuntimeError("Synchronous tool call would block the event loop; await the coroutine instead")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=Config.TOOL_CALL_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+    
+    @staticmethod
+    def _bound_tool_output(result: Any) -> str:
+        """Serialize a tool result, truncated so one call cannot flood the agent prompt"""
+        text = result if isinstance(result, str) else orjson.dumps(result, default=str).decode()
+        if len(text) <= Config.TOOL_OUTPUT_MAX_CHARS:
+            return text
+        dropped = len(text) - Config.TOOL_OUTPUT_MAX_CHARS
+        return f"{text[:Config.TOOL_OUTPUT_MAX_CHARS]}... [truncated {dropped} chars]"
+    
+    def _create_tool(self, name: str, coroutine: Callable, description: str,
+                     args_schema: type, cache_ttl: Optional[int] = None) -> CrewTool:
+        """Build an agent tool backed by a coroutine on the shared event loop"""
+        async def acall(**kwargs):
+            # Fill schema defaults the agent omitted before calling through
+            params = args_schema(**kwargs).model_dump()
+            try:
+                if cache_ttl:
+                    result = await self.tool_cache.get_or_call(name, params, lambda: coroutine(**params), cache_ttl)
+                else:
+                    result = await coroutine(**params)
+            except Exception as e:
+                # Report the failure so the agent does not read it as "nothing found"
+                logger.error(f"Tool {name} failed: {e}")
+                return f"ERROR: {name} is unavailable ({type(e).__name__}: {e})"
+            return self._bound_tool_output(result)
+        
+        def call(**kwargs):
+            # Crews run in worker threads, so hand the coroutine to the server loop
+            try:
+                return self._run_on_loop(acall(**kwargs))
+            except FutureTimeoutError:
+                logger.error(f"Tool {name} timed out")
+                return f"ERROR: {name} timed out after {Config.TOOL_CALL_TIMEOUT:g}s"
+        
+        return CrewTool(name=name, description=description, func=call, args_schema=args_schema)
+    
+    def _create_agents(self) -> Dict[str, Agent]:
+        """Fresh agents for one incident; CrewAI keeps per-run executor state on each agent"""
+        return {
+            "sos": self._create_sos_analyzer(),
+            "weather": self._create_weather_monitor(),
+            "satellite": self._create_satellite_analyst(),
+            "resource": self._create_resource_coordinator(),
+            "communication": self._create_communication_agent()
+        }
+    
     def _create_sos_analyzer(self) -> Agent:
         """Agent for analyzing SOS messages from Twitter"""
         return Agent(
@@ -466,13 +951,16 @@ class DisasterResponseCrew:
             verbose=True,
             allow_delegation=False,
             llm=self.llm,
+            max_iter=Config.AGENT_MAX_ITER,
             tools=[
-                Tool(
+                self._create_tool(
                     name="twitter_monitor",
-                    func=lambda x: asyncio.run(self.twitter_api.monitor_sos_keywords(
-                        ["SOS", "help", "emergency", "trapped"], (0, 0)
-                    )),
-                    description="Monitor Twitter for SOS keywords"
+                    coroutine=lambda lat, lng, keywords: self.twitter_api.monitor_sos_keywords(
+                        keywords, (lat, lng)
+                    ),
+                    description="Monitor Twitter for SOS keywords",
+                    args_schema=SOSSearchInput,
+                    cache_ttl=60
                 )
             ]
         )
@@ -486,11 +974,14 @@ class DisasterResponseCrew:
             verbose=True,
             allow_delegation=False,
             llm=self.llm,
+            max_iter=Config.AGENT_MAX_ITER,
             tools=[
-                Tool(
+                self._create_tool(
                     name="weather_check",
-                    func=lambda x: asyncio.run(self.weather_api.get_weather(0, 0)),
-                    description="Check current weather conditions"
+                    coroutine=lambda lat, lng: self.weather_api.fetch_weather(lat, lng),
+                    description="Check current weather conditions",
+                    args_schema=LocationInput,
+                    cache_ttl=300
                 )
             ]
         )
@@ -504,16 +995,23 @@ class DisasterResponseCrew:
             verbose=True,
             allow_delegation=False,
             llm=self.llm,
+            max_iter=Config.AGENT_MAX_ITER,
             tools=[
-                Tool(
+                self._create_tool(
                     name="nasa_fires",
-                    func=lambda x: asyncio.run(self.nasa_api.get_active_fires(0, 0)),
-                    description="Detect active fires from NASA satellite data"
+                    coroutine=lambda lat, lng, radius_km: self.nasa_api.fetch_active_fires(
+                        lat, lng, radius_km
+                    ),
+                    description="Detect active fires from NASA satellite data",
+                    args_schema=FireSearchInput,
+                    cache_ttl=900
                 ),
-                Tool(
+                self._create_tool(
                     name="terrain_analysis",
-                    func=lambda x: asyncio.run(self.gee_api.get_terrain_data(0, 0)),
-                    description="Analyze terrain and flood risk"
+                    coroutine=lambda lat, lng: self.gee_api.fetch_terrain_data(lat, lng),
+                    description="Analyze terrain and flood risk",
+                    args_schema=LocationInput,
+                    cache_ttl=3600
                 )
             ]
         )
@@ -526,7 +1024,8 @@ class DisasterResponseCrew:
             backstory='Emergency management specialist with logistics expertise',
             verbose=True,
             allow_delegation=True,
-            llm=self.llm
+            llm=self.llm,
+            max_iter=Config.AGENT_MAX_ITER
         )
     
     def _create_communication_agent(self) -> Agent:
@@ -538,68 +1037,106 @@ class DisasterResponseCrew:
             verbose=True,
             allow_delegation=False,
             llm=self.llm,
+            max_iter=Config.AGENT_MAX_ITER,
             tools=[
-                Tool(
+                self._create_tool(
                     name="send_alerts",
-                    func=lambda x: asyncio.run(self.aws.send_evacuation_alert(
-                        "Evacuation notice", []
-                    )),
-                    description="Send evacuation alerts via SNS"
+                    coroutine=self.aws.send_evacuation_alert,
+                    description="Send evacuation alerts via SNS",
+                    args_schema=AlertInput
                 )
             ]
         )
     
+    def _create_task_templates(self) -> Dict[str, Task]:
+        """Incident task templates with str.format placeholders; agents are bound per incident"""
+        return {
+            "sos": Task(
+                description="Monitor and extract SOS messages near {location}",
+                expected_output="List of verified SOS messages with locations"
+            ),
+            "weather": Task(
+                description="Analyze weather conditions at {location}. Current observations: {weather}",
+                expected_output="Weather report with risk assessment"
+            ),
+            "satellite": Task(
+                description=(
+                    "Analyze satellite data for {type} at {location}. "
+                    "Satellite readings: {satellite}. Terrain: {terrain}"
+                ),
+                expected_output="Satellite analysis report with fire/flood detection"
+            ),
+            "resource": Task(
+                description="Coordinate resources for {severity} {type}",
+                expected_output="Resource allocation plan"
+            ),
+            "communication": Task(
+                description="Prepare and send evacuation alerts for affected area",
+                expected_output="Communication plan with alert status"
+            )
+        }
+    
+    async def _kickoff(self, crew: Crew) -> Any:
+        """Run a blocking crew kickoff on the dedicated crew executor"""
+        return await self._loop.run_in_executor(self._crew_executor, crew.kickoff)
+    
+    async def close(self):
+        """Release the crew executor and tool cache connections"""
+        self._crew_executor.shutdown(wait=False, cancel_futures=True)
+        await self.tool_cache.close()
+    
     async def process_incident(self, incident: Incident) -> Dict:
         """Main crew execution for incident processing"""
         logger.info(f"Processing incident: {incident.id}")
         
-        # Create tasks
-        sos_task = Task(
-            description=f"Monitor and extract SOS messages near {incident.location}",
-            agent=self.sos_analyzer_agent,
-            expected_output="List of verified SOS messages with locations"
-        )
-        
-        weather_task = Task(
-            description=f"Analyze weather conditions at {incident.location}",
-            agent=self.weather_monitor_agent,
-            expected_output="Weather report with risk assessment"
+        # Fetch independent data sources concurrently
+        lat, lon = incident.location["lat"], incident.location["lng"]
+        incident.weather_data, fires, incident.terrain_data = await asyncio.gather(
+            self.weather_api.get_weather(lat, lon),
+            self.nasa_api.get_active_fires(lat, lon),
+            self.gee_api.get_terrain_data(lat, lon)
         )
+        incident.satellite_data = {"active_fires": fires}
         
-        satellite_task = Task(
-            description=f"Analyze satellite data for {incident.type.value} at {incident.location}",
-            agent=self.satellite_analyst_agent,
-            expected_output="Satellite analysis report with fire/flood detection"
-        )
+        # Specialize the prebuilt task templates for this incident, each with its own agent
+        agents = self._create_agents()
+        fields = {
+            "location": incident.location,
+            "type": incident.type.value,
+            "severity": incident.severity.value,
+            "weather": incident.weather_data,
+            "satellite": incident.satellite_data,
+            "terrain": incident.terrain_data
+        }
+        tasks = {
+            name: template.model_copy(update={
+                "id": uuid.uuid4(),
+                "description": template.description.format(**fields),
+                "agent": agents[name]
+            })
+            for name, template in self._task_templates.items()
+        }
         
-        resource_task = Task(
-            description=f"Coordinate resources for {incident.severity.value} {incident.type.value}",
-            agent=self.resource_coordinator_agent,
-            expected_output="Resource allocation plan"
-        )
+        # Phase 1: independent data-gathering agents run as one-agent crews in parallel
+        data_tasks = [tasks["sos"], tasks["weather"], tasks["satellite"]]
+        await asyncio.gather(*[
+            self._kickoff(Crew(agents=[task.agent], tasks=[task], verbose=True))
+            for task in data_tasks
+        ])
         
-        communication_task = Task(
-            description=f"Prepare and send evacuation alerts for affected area",
-            agent=self.communication_agent,
-            expected_output="Communication plan with alert status"
-        )
+        # Phase 2: response planning consumes the gathered outputs
+        resource_task = tasks["resource"]
+        resource_task.context = data_tasks
+        communication_task = tasks["communication"]
+        communication_task.context = data_tasks + [resource_task]
         
-        # Create crew with sequential process
-        crew = Crew(
-            agents=[
-                self.sos_analyzer_agent,
-                self.weather_monitor_agent,
-                self.satellite_analyst_agent,
-                self.resource_coordinator_agent,
-                self.communication_agent
-            ],
-            tasks=[sos_task, weather_task, satellite_task, resource_task, communication_task],
+        response_crew = Crew(
+            agents=[agents["resource"], agents["communication"]],
+            tasks=[resource_task, communication_task],
             process=Process.sequential,
             verbose=True
         )
-        
-        # Execute crew
-        result = crew.kickoff()
+        result = await self._kickoff(response_crew)
         
         logger.info(f"Incident {incident.id} processing complete")
         return {
@@ -613,7 +1150,11 @@ class DisasterResponseCrew:
 # FASTAPI BACKEND
 # ============================================================================
 
-app = FastAPI(title="Disaster Response AI Agent API", version="1.0.0")
+app = FastAPI(
+    title="Disaster Response AI Agent API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -632,10 +1173,27 @@ aws_service = None
 async def startup_event():
     """Initialize services on startup"""
     global crew_system, aws_service
-    crew_system = DisasterResponseCrew()
+    app.state.http = create_http_session()
+    app.state.openai_http = create_openai_http_client()
+    # CrewAI calls go through LiteLLM; route them over the shared pool too
+    litellm.client_session = app.state.openai_http
     aws_service = AWSService()
+    crew_system = DisasterResponseCrew(app.state.http, app.state.openai_http, aws_service)
+    aws_service.start_sos_flusher()
     logger.info("FastAPI server started")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    try:
+        await aws_service.stop_sos_flusher()
+    finally:
+        await crew_system.close()
+        await app.state.http.close()
+        litellm.client_session = None
+        app.state.openai_http.close()
+        logger.info("FastAPI server stopped")
+
 @app.get("/")
 async def root():
     return {
@@ -648,7 +1206,7 @@ async def root():
 async def create_incident(incident_data: IncidentCreate, background_tasks: BackgroundTasks):
     """Create new incident and process in background"""
     incident = Incident(
-        id=f"INC-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        id=f"INC-{ULID()}",
         type=IncidentType(incident_data.type),
         location=incident_data.location,
         severity=Severity.HIGH,
@@ -668,7 +1226,7 @@ async def create_incident(incident_data: IncidentCreate, background_tasks: Backg
 async def submit_sos(sos_data: SOSMessageCreate):
     """Submit SOS message"""
     sos = SOSMessage(
-        id=f"SOS-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        id=f"SOS-{ULID()}",
         text=sos_data.text,
         location=sos_data.location,
         timestamp=datetime.now(),
@@ -676,7 +1234,11 @@ async def submit_sos(sos_data: SOSMessageCreate):
     )
     
     # Store in DynamoDB
-    await aws_service.store_sos_message(sos)
+    try:
+        await aws_service.store_sos_message(sos)
+    except asyncio.QueueFull:
+        logger.error(f"SOS queue full, rejecting {sos.id}")
+        raise HTTPException(status_code=503, detail="SOS backlog full, please retry")
     
     return {
         "sos_id": sos.id,
@@ -720,7 +1282,10 @@ async def main():
     print()
     
     # Initialize system
-    crew = DisasterResponseCrew()
+    http_session = create_http_session()
+    openai_http = create_openai_http_client()
+    litellm.client_session = openai_http
+    crew = DisasterResponseCrew(http_session, openai_http, AWSService())
     
     # Test incident
     test_incident = Incident(
@@ -738,16 +1303,33 @@ async def main():
     print()
     
     # Process incident
-    result = await crew.process_incident(test_incident)
+    try:
+        result = await crew.process_incident(test_incident)
+    finally:
+        await crew.close()
+        await http_session.close()
+        litellm.client_session = None
+        openai_http.close()
     
     print("\n" + "=" * 80)
     print("PROCESSING COMPLETE")
     print("=" * 80)
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
-    # Run FastAPI server
-    # uvicorn.run(app, host="0.0.0.0", port=8000)
-    
-    # Or run test
-    asyncio.run(main())
\ No newline at end of file
+    if sys.argv[1:] == ["serve"]:
+        # Workers read WEB_CONCURRENCY to detect a multi-process deployment
+        os.environ.setdefault("WEB_CONCURRENCY", "4")
+        # Run FastAPI server (use gunicorn.conf.py in production)
+        uvicorn.run(
+            "disaster_response:app",
+            host=os.getenv("API_HOST", "0.0.0.0"),
+            port=int(os.getenv("API_PORT", "8000")),
+            workers=int(os.environ["WEB_CONCURRENCY"]),
+            # "auto" prefers uvloop/httptools when installed (uvloop is unavailable on Windows)
+            loop="auto",
+            http="auto"
+        )
+    else:
+        # Or run test
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Disaster Response API
+
+Usage: gunicorn -c gunicorn.conf.py disaster_response:app
+"""
+
+import os
+
+# Server socket
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+
+# Worker processes: uvicorn workers pick up uvloop/httptools from uvicorn[standard]
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+os.environ["WEB_CONCURRENCY"] = str(workers)  # lets the app detect multiple workers
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("AGENT_TIMEOUT", "300"))
+keepalive = 75
+
+# Import the app once in the master; per-worker clients are built in startup_event
+preload_app = True
@@ -0,0 +1,84 @@
+"""Tests for FIRMS bounding boxes and fire CSV parsing in NASAFirmsAPI"""
+
+import pytest
+
+from disaster_response import NASAFirmsAPI
+
+HEADER = b"latitude,longitude,bright_ti4,scan,track,acq_date,confidence\n"
+
+
+def make_csv(*rows) -> bytes:
+    return HEADER + b"".join(
+        f"{lat},{lon},{brightness},0.4,0.4,2024-01-01,n\n".encode()
+        for lat, lon, brightness in rows
+    )
+
+
+def parse_box(box: str):
+    return [float(v) for v in box.split(",")]
+
+
+def test_bounding_box_within_range():
+    boxes = NASAFirmsAPI._bounding_boxes(0.0, 10.0, 111)
+
+    assert len(boxes) == 1
+    assert parse_box(boxes[0]) == pytest.approx([9.0, -1.0, 11.0, 1.0], abs=1e-3)
+
+
+def test_bounding_box_splits_west_of_antimeridian():
+    # Fiji: the radius reaches past 180 degrees east
+    boxes = [parse_box(b) for b in NASAFirmsAPI._bounding_boxes(-17.7, 179.5, 100)]
+
+    assert len(boxes) == 2
+    (w1, _, e1, _), (w2, _, e2, _) = boxes
+    assert w1 < 179.5 and e1 == 180.0
+    assert w2 == -180.0 and -180.0 < e2 < -179.0
+
+
+def test_bounding_box_splits_east_of_antimeridian():
+    # Aleutians: the radius reaches past 180 degrees west
+    boxes = [parse_box(b) for b in NASAFirmsAPI._bounding_boxes(52.0, -179.8, 100)]
+
+    assert len(boxes) == 2
+    (w1, _, e1, _), (w2, _, e2, _) = boxes
+    assert 178.0 < w1 < 180.0 and e1 == 180.0
+    assert w2 == -180.0 and e2 > -179.8
+
+
+def test_bounding_box_near_pole_covers_all_longitudes():
+    boxes = [parse_box(b) for b in NASAFirmsAPI._bounding_boxes(89.9, 0.0, 50)]
+
+    assert len(boxes) == 1
+    assert boxes[0][0] == -180.0 and boxes[0][2] == 180.0
+    assert boxes[0][3] == 90.0
+
+
+def test_parse_keeps_fires_within_radius():
+    csv_data = make_csv((34.05, -118.24, 330.0), (34.30, -118.24, 350.0), (36.00, -118.24, 400.0))
+
+    fires = NASAFirmsAPI._parse_fire_data([csv_data], 34.05, -118.24, 50)
+
+    # ~28 km away is kept, ~217 km away is not; brightest first
+    assert [f["brightness"] for f in fires] == [350.0, 330.0]
+    assert set(fires[0]) == {"latitude", "longitude", "brightness", "confidence"}
+
+
+def test_parse_merges_boxes_across_antimeridian():
+    east = make_csv((-17.7, 179.9, 320.0))
+    west = make_csv((-17.7, -179.9, 340.0), (-17.7, -175.0, 500.0))
+
+    fires = NASAFirmsAPI._parse_fire_data([east, west], -17.7, 179.5, 100)
+
+    assert [f["brightness"] for f in fires] == [340.0, 320.0]
+
+
+def test_parse_returns_top_ten_brightest():
+    csv_data = make_csv(*[(0.0, 0.0, 300.0 + i) for i in range(15)])
+
+    fires = NASAFirmsAPI._parse_fire_data([csv_data], 0.0, 0.0, 10)
+
+    assert [f["brightness"] for f in fires] == [314.0 - i for i in range(10)]
+
+
+def test_parse_empty_csv():
+    assert NASAFirmsAPI._parse_fire_data([HEADER, HEADER], 0.0, 0.0, 50) == []
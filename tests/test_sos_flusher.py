@@ -0,0 +1,112 @@
+"""Tests for the batched SOS DynamoDB writer in AWSService"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from disaster_response import AWSService, Config, SOSMessage
+
+
+def make_sos(i: int) -> SOSMessage:
+    return SOSMessage(
+        id=f"SOS-{i}",
+        text="trapped",
+        location={"lat": 34.05, "lng": -118.24},
+        timestamp=datetime.now(),
+        source="manual"
+    )
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    monkeypatch.setattr(Config, "SOS_RETRY_BACKOFF", 0)
+    service = AWSService()
+    service.batches = []
+    monkeypatch.setattr(service, "_put_sos_batch", lambda batch: service.batches.append([s.id for s in batch]))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_flushes_full_batches(aws):
+    for i in range(60):
+        await aws.store_sos_message(make_sos(i))
+    aws.start_sos_flusher()
+    await aws.stop_sos_flusher()
+    
+    assert [len(b) for b in aws.batches] == [25, 25, 10]
+    assert [i for b in aws.batches for i in b] == [f"SOS-{i}" for i in range(60)]
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_interval(aws, monkeypatch):
+    monkeypatch.setattr(Config, "SOS_FLUSH_INTERVAL", 0.05)
+    aws.start_sos_flusher()
+    for i in range(3):
+        await aws.store_sos_message(make_sos(i))
+    await asyncio.sleep(0.2)
+    
+    assert aws.batches == [["SOS-0", "SOS-1", "SOS-2"]]
+    await aws.stop_sos_flusher()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_messages(aws, monkeypatch):
+    monkeypatch.setattr(Config, "SOS_FLUSH_INTERVAL", 60)
+    aws.start_sos_flusher()
+    for i in range(3):
+        await aws.store_sos_message(make_sos(i))
+    await aws.stop_sos_flusher()
+    
+    assert aws.batches == [["SOS-0", "SOS-1", "SOS-2"]]
+    assert aws._sos_flusher is None
+
+
+@pytest.mark.asyncio
+async def test_transient_write_error_is_retried(aws, monkeypatch):
+    attempts = []
+    
+    def flaky_put(batch):
+        attempts.append(len(batch))
+        if len(attempts) == 1:
+            raise EndpointConnectionError(endpoint_url="https://dynamodb")
+        aws.batches.append([s.id for s in batch])
+    
+    monkeypatch.setattr(aws, "_put_sos_batch", flaky_put)
+    await aws.store_sos_message(make_sos(0))
+    aws.start_sos_flusher()
+    await aws.stop_sos_flusher()
+    
+    assert attempts == [1, 1]
+    assert aws.batches == [["SOS-0"]]
+
+
+@pytest.mark.asyncio
+async def test_flusher_survives_failed_batch(aws, monkeypatch):
+    monkeypatch.setattr(Config, "SOS_FLUSH_INTERVAL", 0.01)
+    
+    def put(batch):
+        if batch[0].id == "SOS-0":
+            raise EndpointConnectionError(endpoint_url="https://dynamodb")
+        aws.batches.append([s.id for s in batch])
+    
+    monkeypatch.setattr(aws, "_put_sos_batch", put)
+    aws.start_sos_flusher()
+    await aws.store_sos_message(make_sos(0))
+    await asyncio.sleep(0.1)
+    await aws.store_sos_message(make_sos(1))
+    await aws.stop_sos_flusher()
+    
+    assert aws.batches == [["SOS-1"]]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_messages(monkeypatch):
+    monkeypatch.setattr(Config, "SOS_QUEUE_SIZE", 2)
+    aws = AWSService()
+    await aws.store_sos_message(make_sos(0))
+    await aws.store_sos_message(make_sos(1))
+    
+    with pytest.raises(asyncio.QueueFull):
+        await aws.store_sos_message(make_sos(2))
@@ -0,0 +1,64 @@
+"""Tests for the Redis-backed agent tool result cache"""
+
+import pytest
+
+from disaster_response import ToolResultCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def cache():
+    cache = ToolResultCache()
+    cache.client = FakeRedis()
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_caches_successful_result(cache):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return [{"brightness": 330.0}]
+
+    params = {"lat": 34.05, "lng": -118.24, "radius_km": 50}
+    first = await cache.get_or_call("nasa_fires", params, call, 900)
+    second = await cache.get_or_call("nasa_fires", params, call, 900)
+
+    assert first == second == [{"brightness": 330.0}]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_not_cached(cache):
+    async def failing():
+        raise TimeoutError("FIRMS timed out")
+
+    async def succeeding():
+        return [{"brightness": 330.0}]
+
+    params = {"lat": 34.05, "lng": -118.24, "radius_km": 50}
+    with pytest.raises(TimeoutError):
+        await cache.get_or_call("nasa_fires", params, failing, 900)
+    assert cache.client.store == {}
+
+    assert await cache.get_or_call("nasa_fires", params, succeeding, 900) == [{"brightness": 330.0}]
+
+
+def test_key_coarsens_coordinates():
+    near = ToolResultCache._key("weather_check", {"lat": 34.0522, "lng": -118.2437})
+    same_cell = ToolResultCache._key("weather_check", {"lat": 34.0531, "lng": -118.2441})
+    other = ToolResultCache._key("weather_check", {"lat": 34.1522, "lng": -118.2437})
+
+    assert near == same_cell
+    assert near != other